@@ -1,4 +1,5 @@
 import logging
+from types import MappingProxyType
 from typing import List
 
 from meal_max.models.kitchen_model import Meal, update_meal_stats
@@ -10,6 +11,11 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
+# Built once at import time so get_battle_score does not allocate a fresh
+# dict per call; the proxy keeps it read-only.
+_DIFFICULTY_MOD = MappingProxyType({"HIGH": 1, "MED": 2, "LOW": 3})
+
+
 class BattleModel:
 
     def __init__(self):
@@ -73,14 +79,12 @@ class BattleModel:
         self.combatants.clear()
 
     def get_battle_score(self, combatant: Meal) -> float:
-        difficulty_modifier = {"HIGH": 1, "MED": 2, "LOW": 3}
-
         # Log the calculation process
         logger.info("Calculating battle score for %s: price=%.3f, cuisine=%s, difficulty=%s",
                     combatant.meal, combatant.price, combatant.cuisine, combatant.difficulty)
 
         # Calculate score
-        score = (combatant.price * len(combatant.cuisine)) - difficulty_modifier[combatant.difficulty]
+        score = (combatant.price * len(combatant.cuisine)) - _DIFFICULTY_MOD[combatant.difficulty]
 
         # Log the calculated score
         logger.info("Battle score for %s: %.3f", combatant.meal, score)
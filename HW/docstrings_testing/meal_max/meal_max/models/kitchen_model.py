@@ -1,8 +1,10 @@
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 import logging
 import os
 import sqlite3
-from typing import Any
+from typing import Any, Iterable
 
 from meal_max.utils.sql_utils import get_db_connection
 from meal_max.utils.logger import configure_logger
@@ -12,8 +14,14 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
-@dataclass
+# frozen makes Meal hashable (required by the lookup caches) and __slots__
+# drops the per-instance __dict__, which matters when a leaderboard
+# materializes many Meal objects at once. __slots__ is declared by hand
+# because dataclass(slots=True) needs Python 3.10 and the Docker images run 3.9.
+@dataclass(frozen=True)
 class Meal:
+    __slots__ = ("id", "meal", "cuisine", "price", "difficulty")
+
     id: int
     meal: str
     cuisine: str
@@ -27,6 +35,32 @@ class Meal:
             raise ValueError("Difficulty must be 'LOW', 'MED', or 'HIGH'.")
 
 
+# SQL statements used by the functions below. Keeping them as module-level
+# constants means each string is built once per process and sqlite3's
+# per-connection statement cache can key on the identical text, so the
+# parse/plan step is not repeated on every call.
+_SQL_INSERT_MEAL = """
+    INSERT INTO meals (meal, cuisine, price, difficulty)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_SELECT_BY_ID = "SELECT id, meal, cuisine, price, difficulty, deleted FROM meals WHERE id = ?"
+_SQL_SELECT_BY_NAME = "SELECT id, meal, cuisine, price, difficulty, deleted FROM meals WHERE meal = ?"
+_SQL_SELECT_DELETED = "SELECT deleted FROM meals WHERE id = ?"
+_SQL_UPDATE_WIN = "UPDATE meals SET battles = battles + 1, wins = wins + 1 WHERE id = ?"
+_SQL_UPDATE_LOSS = "UPDATE meals SET battles = battles + 1 WHERE id = ?"
+_SQL_SOFT_DELETE = "UPDATE meals SET deleted = TRUE WHERE id = ?"
+
+# Cap on rows handed to a single executemany() call so huge batches are
+# inserted in pages rather than bound all at once.
+_BULK_INSERT_PAGE_SIZE = 10_000
+
+
+def _clear_meal_caches() -> None:
+    """Drop cached get_meal_by_id / get_meal_by_name results after a write."""
+    get_meal_by_id.cache_clear()
+    get_meal_by_name.cache_clear()
+
+
 def create_meal(meal: str, cuisine: str, price: float, difficulty: str) -> None:
     if not isinstance(price, (int, float)) or price <= 0:
         raise ValueError(f"Invalid price: {price}. Price must be a positive number.")
@@ -36,12 +70,10 @@ def create_meal(meal: str, cuisine: str, price: float, difficulty: str) -> None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO meals (meal, cuisine, price, difficulty)
-                VALUES (?, ?, ?, ?)
-            """, (meal, cuisine, price, difficulty))
+            cursor.execute(_SQL_INSERT_MEAL, (meal, cuisine, price, difficulty))
             conn.commit()
 
+            _clear_meal_caches()
             logger.info("Meal successfully added to the database: %s", meal)
 
     except sqlite3.IntegrityError:
@@ -52,6 +84,46 @@ def create_meal(meal: str, cuisine: str, price: float, difficulty: str) -> None:
         logger.error("Database error: %s", str(e))
         raise e
 
+def create_meals(rows: Iterable[tuple]) -> None:
+    """
+    Inserts many meals in one transaction.
+
+    Each row is a (meal, cuisine, price, difficulty) tuple. All rows are
+    validated up front, then inserted with executemany in pages, so a bulk
+    load pays for one commit instead of one per meal.
+
+    Raises:
+        ValueError: If any row has an invalid price/difficulty, or a meal
+            name already exists.
+        sqlite3.Error: If any database error occurs.
+    """
+    validated = []
+    for meal, cuisine, price, difficulty in rows:
+        if not isinstance(price, (int, float)) or price <= 0:
+            raise ValueError(f"Invalid price: {price}. Price must be a positive number.")
+        if difficulty not in ['LOW', 'MED', 'HIGH']:
+            raise ValueError(f"Invalid difficulty level: {difficulty}. Must be 'LOW', 'MED', or 'HIGH'.")
+        validated.append((meal, cuisine, price, difficulty))
+
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            remaining = iter(validated)
+            while page := list(islice(remaining, _BULK_INSERT_PAGE_SIZE)):
+                cursor.executemany(_SQL_INSERT_MEAL, page)
+            conn.commit()
+
+            _clear_meal_caches()
+            logger.info("Batch of %d meals successfully added to the database.", len(validated))
+
+    except sqlite3.IntegrityError:
+        logger.error("Duplicate meal name in batch insert")
+        raise ValueError("One or more meals in the batch already exist")
+
+    except sqlite3.Error as e:
+        logger.error("Database error: %s", str(e))
+        raise e
+
 def clear_meals() -> None:
     """
     Recreates the meals table, effectively deleting all meals.
@@ -67,6 +139,7 @@ def clear_meals() -> None:
             cursor.executescript(create_table_script)
             conn.commit()
 
+            _clear_meal_caches()
             logger.info("Meals cleared successfully.")
 
     except sqlite3.Error as e:
@@ -77,7 +150,7 @@ def delete_meal(meal_id: int) -> None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT deleted FROM meals WHERE id = ?", (meal_id,))
+            cursor.execute(_SQL_SELECT_DELETED, (meal_id,))
             try:
                 deleted = cursor.fetchone()[0]
                 if deleted:
@@ -87,9 +160,10 @@ def delete_meal(meal_id: int) -> None:
                 logger.info("Meal with ID %s not found", meal_id)
                 raise ValueError(f"Meal with ID {meal_id} not found")
 
-            cursor.execute("UPDATE meals SET deleted = TRUE WHERE id = ?", (meal_id,))
+            cursor.execute(_SQL_SOFT_DELETE, (meal_id,))
             conn.commit()
 
+            _clear_meal_caches()
             logger.info("Meal with ID %s marked as deleted.", meal_id)
 
     except sqlite3.Error as e:
@@ -113,22 +187,18 @@ def get_leaderboard(sort_by: str="wins") -> dict[str, Any]:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            # sqlite3.Row copies column names at the C level, which is much
+            # cheaper than building each dict from eight literals in Python.
+            # Set on the cursor so pooled connections are not affected.
+            cursor.row_factory = sqlite3.Row
+            cursor.arraysize = 1000
             cursor.execute(query)
             rows = cursor.fetchall()
 
-        leaderboard = []
-        for row in rows:
-            meal = {
-                'id': row[0],
-                'meal': row[1],
-                'cuisine': row[2],
-                'price': row[3],
-                'difficulty': row[4],
-                'battles': row[5],
-                'wins': row[6],
-                'win_pct': round(row[7] * 100, 1)  # Convert to percentage
-            }
-            leaderboard.append(meal)
+        leaderboard = [
+            dict(row, win_pct=round(row['win_pct'] * 100, 1))  # Convert to percentage
+            for row in rows
+        ]
 
         logger.info("Leaderboard retrieved successfully")
         return leaderboard
@@ -137,11 +207,12 @@ def get_leaderboard(sort_by: str="wins") -> dict[str, Any]:
         logger.error("Database error: %s", str(e))
         raise e
 
+@lru_cache(maxsize=1024)
 def get_meal_by_id(meal_id: int) -> Meal:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT id, meal, cuisine, price, difficulty, deleted FROM meals WHERE id = ?", (meal_id,))
+            cursor.execute(_SQL_SELECT_BY_ID, (meal_id,))
             row = cursor.fetchone()
 
             if row:
@@ -158,11 +229,12 @@ def get_meal_by_id(meal_id: int) -> Meal:
         raise e
 
 
+@lru_cache(maxsize=1024)
 def get_meal_by_name(meal_name: str) -> Meal:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT id, meal, cuisine, price, difficulty, deleted FROM meals WHERE meal = ?", (meal_name,))
+            cursor.execute(_SQL_SELECT_BY_NAME, (meal_name,))
             row = cursor.fetchone()
 
             if row:
@@ -183,7 +255,7 @@ def update_meal_stats(meal_id: int, result: str) -> None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT deleted FROM meals WHERE id = ?", (meal_id,))
+            cursor.execute(_SQL_SELECT_DELETED, (meal_id,))
             try:
                 deleted = cursor.fetchone()[0]
                 if deleted:
@@ -194,14 +266,16 @@ def update_meal_stats(meal_id: int, result: str) -> None:
                 raise ValueError(f"Meal with ID {meal_id} not found")
 
             if result == 'win':
-                cursor.execute("UPDATE meals SET battles = battles + 1, wins = wins + 1 WHERE id = ?", (meal_id,))
+                cursor.execute(_SQL_UPDATE_WIN, (meal_id,))
             elif result == 'loss':
-                cursor.execute("UPDATE meals SET battles = battles + 1 WHERE id = ?", (meal_id,))
+                cursor.execute(_SQL_UPDATE_LOSS, (meal_id,))
             else:
                 raise ValueError(f"Invalid result: {result}. Expected 'win' or 'loss'.")
 
             conn.commit()
 
+            _clear_meal_caches()
+
     except sqlite3.Error as e:
         logger.error("Database error: %s", str(e))
         raise e
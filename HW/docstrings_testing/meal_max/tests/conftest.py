@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+import meal_max.models.kitchen_model as kitchen_model
+
+
+SQL_CREATE_TABLE_PATH = Path(__file__).resolve().parent.parent / "sql" / "create_meal_table.sql"
+
+
+@pytest.fixture(scope="session")
+def db_conn():
+    """
+    A single in-memory SQLite connection shared by the whole test session.
+
+    File-backed SQLite spends most of its time in fsync; :memory: removes the
+    I/O entirely, and keeping one long-lived connection keeps the page and
+    statement caches hot. Session scope also plays well with pytest-xdist,
+    where each worker runs its own session and therefore owns its own
+    private database.
+    """
+    os.environ["SQL_CREATE_TABLE_PATH"] = str(SQL_CREATE_TABLE_PATH)
+
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.executescript(SQL_CREATE_TABLE_PATH.read_text())
+
+    @contextmanager
+    def fake_get_db_connection():
+        yield conn
+
+    original = kitchen_model.get_db_connection
+    kitchen_model.get_db_connection = fake_get_db_connection
+
+    yield conn
+
+    kitchen_model.get_db_connection = original
+    conn.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_modules(db_conn):
+    """
+    Pay one-time import and first-call costs before the first test runs.
+
+    The first create/lookup round trip compiles the module's SQL statements
+    into sqlite3's statement cache, and importing battle_model executes its
+    module body (logger setup, the difficulty table). Doing this once here
+    keeps those costs out of whichever test happens to run first.
+    """
+    from meal_max.models.battle_model import BattleModel
+
+    kitchen_model.create_meal("__warmup__", "none", 1.0, "LOW")
+    warmup = kitchen_model.get_meal_by_name("__warmup__")
+    BattleModel().get_battle_score(warmup)
+    kitchen_model.clear_meals()
@@ -0,0 +1,187 @@
+import pytest
+
+from meal_max.models.kitchen_model import (
+    Meal,
+    create_meal,
+    create_meals,
+    clear_meals,
+    delete_meal,
+    get_leaderboard,
+    get_meal_by_id,
+    get_meal_by_name,
+    update_meal_stats,
+)
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+@pytest.fixture(autouse=True)
+def fresh_meals(db_conn):
+    """Start every test from an empty meals table."""
+    clear_meals()
+
+@pytest.fixture
+def sample_meal():
+    return {"meal": "Pizza", "cuisine": "Italian", "price": 12.5, "difficulty": "MED"}
+
+######################################################
+#
+#    Add and delete
+#
+######################################################
+
+def test_create_meal(sample_meal):
+    """Test creating a new meal and reading it back by name."""
+    create_meal(**sample_meal)
+
+    meal = get_meal_by_name("Pizza")
+    assert meal == Meal(meal.id, "Pizza", "Italian", 12.5, "MED")
+
+def test_create_meal_duplicate(sample_meal):
+    """Test error when creating a meal with a duplicate name."""
+    create_meal(**sample_meal)
+
+    with pytest.raises(ValueError, match="already exists"):
+        create_meal(**sample_meal)
+
+@pytest.mark.parametrize(
+    ("overrides", "match"),
+    [
+        ({"price": -5}, "Invalid price: -5. Price must be a positive number."),
+        ({"difficulty": "EXTREME"}, "Invalid difficulty level: EXTREME. Must be 'LOW', 'MED', or 'HIGH'."),
+    ],
+    ids=["invalid_price", "invalid_difficulty"],
+)
+def test_create_meal_invalid_input(sample_meal, overrides, match):
+    """Test error when trying to create a meal with an invalid price or difficulty."""
+    with pytest.raises(ValueError, match=match):
+        create_meal(**{**sample_meal, **overrides})
+
+def test_create_meals_bulk():
+    """Test inserting several meals in one transaction."""
+    create_meals([
+        ("Pizza", "Italian", 12.5, "MED"),
+        ("Tacos", "Mexican", 9.0, "LOW"),
+        ("Ramen", "Japanese", 11.0, "HIGH"),
+    ])
+
+    assert get_meal_by_name("Tacos").cuisine == "Mexican"
+    assert get_meal_by_name("Ramen").difficulty == "HIGH"
+
+def test_delete_meal(sample_meal):
+    """Test soft deleting a meal by ID."""
+    create_meal(**sample_meal)
+    meal_id = get_meal_by_name("Pizza").id
+
+    delete_meal(meal_id)
+
+    with pytest.raises(ValueError, match=f"Meal with ID {meal_id} has been deleted"):
+        get_meal_by_id(meal_id)
+
+def test_delete_meal_not_found():
+    """Test error when trying to delete a non-existent meal."""
+    with pytest.raises(ValueError, match="Meal with ID 999 not found"):
+        delete_meal(999)
+
+def test_clear_meals(sample_meal):
+    """Test clearing the meals table removes all meals."""
+    create_meal(**sample_meal)
+
+    clear_meals()
+
+    with pytest.raises(ValueError, match="Meal with name Pizza not found"):
+        get_meal_by_name("Pizza")
+
+######################################################
+#
+#    Get Meal
+#
+######################################################
+
+def test_get_meal_by_id(sample_meal):
+    """Test retrieving a meal by its ID."""
+    create_meal(**sample_meal)
+    meal_id = get_meal_by_name("Pizza").id
+
+    assert get_meal_by_id(meal_id) == Meal(meal_id, "Pizza", "Italian", 12.5, "MED")
+
+@pytest.mark.parametrize("deleted", [False, True], ids=["not_found", "deleted"])
+def test_get_meal_by_id_missing(sample_meal, deleted):
+    """Test error when looking up a meal that is absent or soft deleted."""
+    if deleted:
+        create_meal(**sample_meal)
+        meal_id = get_meal_by_name("Pizza").id
+        delete_meal(meal_id)
+        match = f"Meal with ID {meal_id} has been deleted"
+    else:
+        meal_id = 999
+        match = "Meal with ID 999 not found"
+
+    with pytest.raises(ValueError, match=match):
+        get_meal_by_id(meal_id)
+
+def test_get_meal_by_id_cached(sample_meal):
+    """Test that repeated lookups are served from the lru_cache."""
+    create_meal(**sample_meal)
+    meal_id = get_meal_by_name("Pizza").id
+
+    hits_before = get_meal_by_id.cache_info().hits
+    assert get_meal_by_id(meal_id) is get_meal_by_id(meal_id)
+    assert get_meal_by_id.cache_info().hits > hits_before
+
+def test_get_meal_by_name_not_found():
+    """Test error when no meal exists for the given name."""
+    with pytest.raises(ValueError, match="Meal with name Sushi not found"):
+        get_meal_by_name("Sushi")
+
+######################################################
+#
+#    Stats and leaderboard
+#
+######################################################
+
+@pytest.mark.parametrize(
+    ("result", "expected_battles", "expected_wins"),
+    [("win", 1, 1), ("loss", 1, 0)],
+)
+def test_update_meal_stats(sample_meal, result, expected_battles, expected_wins):
+    """Test that a win increments battles and wins while a loss only increments battles."""
+    create_meal(**sample_meal)
+    meal_id = get_meal_by_name("Pizza").id
+
+    update_meal_stats(meal_id, result)
+
+    leaderboard = get_leaderboard()
+    assert leaderboard[0]["battles"] == expected_battles
+    assert leaderboard[0]["wins"] == expected_wins
+
+def test_update_meal_stats_invalid_result(sample_meal):
+    """Test error when passing a result other than 'win' or 'loss'."""
+    create_meal(**sample_meal)
+    meal_id = get_meal_by_name("Pizza").id
+
+    with pytest.raises(ValueError, match="Invalid result: draw. Expected 'win' or 'loss'."):
+        update_meal_stats(meal_id, "draw")
+
+def test_get_leaderboard_sorted_by_wins():
+    """Test that the leaderboard is ordered by wins."""
+    create_meal(meal="Pizza", cuisine="Italian", price=12.5, difficulty="MED")
+    create_meal(meal="Tacos", cuisine="Mexican", price=9.0, difficulty="LOW")
+    pizza_id = get_meal_by_name("Pizza").id
+    tacos_id = get_meal_by_name("Tacos").id
+
+    update_meal_stats(pizza_id, "win")
+    update_meal_stats(tacos_id, "loss")
+
+    leaderboard = get_leaderboard(sort_by="wins")
+    assert leaderboard[0]["meal"] == "Pizza"
+    assert leaderboard[0]["win_pct"] == 100.0
+    assert leaderboard[1]["meal"] == "Tacos"
+
+def test_get_leaderboard_invalid_sort():
+    """Test error when passing an unknown sort_by parameter."""
+    with pytest.raises(ValueError, match="Invalid sort_by parameter"):
+        get_leaderboard(sort_by="price")
@@ -4,11 +4,18 @@ from music_collection.models.playlist_model import PlaylistModel
 from music_collection.models.song_model import Song
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def playlist_model():
-    """Fixture to provide a new instance of PlaylistModel for each test."""
+    """Fixture providing a PlaylistModel shared across the module; state is reset per test."""
     return PlaylistModel()
 
+@pytest.fixture(autouse=True)
+def _reset_playlist_model(playlist_model):
+    """Restore the shared PlaylistModel to a pristine state after each test."""
+    yield
+    playlist_model.playlist.clear()
+    playlist_model.current_track_number = 1
+
 @pytest.fixture
 def mock_update_play_count(mocker):
     """Mock the update_play_count function for testing purposes."""
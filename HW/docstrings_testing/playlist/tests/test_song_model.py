@@ -1,5 +1,4 @@
 from contextlib import contextmanager
-import re
 import sqlite3
 
 import pytest
@@ -23,11 +22,17 @@ from music_collection.models.song_model import (
 ######################################################
 
 def normalize_whitespace(sql_query: str) -> str:
-    return re.sub(r'\s+', ' ', sql_query).strip()
-
-# Mocking the database connection for tests
-@pytest.fixture
-def mock_cursor(mocker):
+    # str.split() with no argument collapses any run of whitespace, so this
+    # matches re.sub(r'\s+', ' ', ...).strip() without re-entering the regex
+    # engine on every SQL assertion.
+    return " ".join(sql_query.split())
+
+# Mocking the database connection for tests. Module scope means the Mock tree
+# is built and get_db_connection patched once for the whole file instead of
+# per test; the autouse fixture below wipes per-test state.
+@pytest.fixture(scope="module")
+def mock_cursor(module_mocker):
+    mocker = module_mocker
     mock_conn = mocker.Mock()
     mock_cursor = mocker.Mock()
 
@@ -46,6 +51,14 @@ def mock_cursor(mocker):
 
     return mock_cursor  # Return the mock cursor so we can set expectations per test
 
+@pytest.fixture(autouse=True)
+def _reset_mock_cursor(mock_cursor):
+    """Clear recorded calls and restore the shared cursor's defaults after each test."""
+    yield
+    mock_cursor.reset_mock(return_value=True, side_effect=True)
+    mock_cursor.fetchone.return_value = None
+    mock_cursor.fetchall.return_value = []
+
 ######################################################
 #
 #    Add and delete